@@ -1,8 +1,18 @@
 """OCRSuite: AI-powered PDF processing for digitizing old books."""
 
+from typing import Any
+
 __version__ = "0.1.0"
 __author__ = "OCRSuite Contributors"
 
-from .main import app
-
 __all__ = ["app"]
+
+
+def __getattr__(name: str) -> Any:
+    # The CLI pulls in typer, rich and the whole pipeline; load it on first
+    # use so that importing a submodule such as ocrsuite.config stays cheap
+    if name == "app":
+        from .main import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,18 @@
 """Output assembly and file generation."""
 
+import shutil
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+import orjson
 from loguru import logger
 
 from .utils import ExtractionError, ensure_directory
 
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB, coalesces segment writes for large documents
+
 
 class OutputAssembler:
     """Assemble extracted content into output files."""
@@ -23,24 +28,28 @@ class OutputAssembler:
         self.output_dir = ensure_directory(output_dir)
         self.source_filename = source_filename
         self.debug = debug
-        self.timestamp = datetime.now().strftime("%d%m%y_%H%M%S")
+        self.created_dt = datetime.now()
+        self.created_human = self.created_dt.strftime("%Y-%m-%d %H:%M:%S")
+        self.timestamp = self.created_dt.strftime("%d%m%y_%H%M%S")
         self.figures_dir = None
+        self.figures_count = 0  # figure_*.png files saved, so callers never rescan figures_dir
         self.metadata: dict[str, Any] = {
-            "created": datetime.now().isoformat(),
+            "created": self.created_dt.isoformat(),
             "pages_processed": 0,
             "errors": [],
         }
 
     def save_markdown(
         self,
-        content: str,
+        content: str | Iterable[str],
         filename: Optional[str] = None,
         title: Optional[str] = None,
     ) -> Path:
         """Save content as single Markdown file with linked figures.
 
         Args:
-            content: Markdown content with figure references.
+            content: Markdown content with figure references, either as one string
+                or as an iterable of sections written separated by blank lines.
             filename: Output filename (default: DDMMYY_HHMMSS_sourcename.md).
             title: Document title for header.
 
@@ -54,28 +63,36 @@ class OutputAssembler:
             if filename is None:
                 filename = f"{self.timestamp}_{self.source_filename}.md"
 
-            # Build markdown with header
-            md_lines = []
+            header = ""
             if title:
-                md_lines.append(f"# {title}\n")
-                md_lines.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n")
-
-            md_lines.append(content)
+                header = f"# {title}\n*Generated: {self.created_human}*\n"
 
             # Add metadata section at end
-            if self.metadata["errors"]:
-                md_lines.append("\n---\n")
-                md_lines.append("## Processing Notes\n")
-                md_lines.append(f"- Pages processed: {self.metadata['pages_processed']}\n")
-                md_lines.append(f"- Errors: {len(self.metadata['errors'])}\n")
-                for error in self.metadata["errors"]:
-                    md_lines.append(f"  - {error}\n")
-
-            full_content = "".join(md_lines)
-
+            footer = ""
+            errors = self.metadata["errors"]
+            if errors:
+                error_lines = "\n".join(map("  - {}".format, errors))
+                footer = (
+                    "\n---\n"
+                    "## Processing Notes\n"
+                    f"- Pages processed: {self.metadata['pages_processed']}\n"
+                    f"- Errors: {len(errors)}\n"
+                    f"{error_lines}\n"
+                )
+
+            # Write segments straight to the file instead of concatenating the
+            # whole document in memory first
             output_path = self.output_dir / filename
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(full_content)
+            with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(header)
+                if isinstance(content, str):
+                    f.write(content)
+                else:
+                    for index, section in enumerate(content):
+                        if index:
+                            f.write("\n\n")
+                        f.write(section)
+                f.write(footer)
 
             logger.info(f"Saved Markdown to {output_path}")
             return output_path
@@ -83,6 +100,28 @@ class OutputAssembler:
         except Exception as e:
             raise ExtractionError(f"Failed to save Markdown file: {e}") from e
 
+    def save_metadata_json(self, filename: str = "metadata.json") -> Path:
+        """Save processing metadata (creation time, page count, errors) as JSON.
+
+        Args:
+            filename: Output filename in the output directory.
+
+        Returns:
+            Path to saved file.
+
+        Raises:
+            ExtractionError: If save fails.
+        """
+        try:
+            output_path = self.output_dir / filename
+            output_path.write_bytes(orjson.dumps(self.metadata, option=orjson.OPT_INDENT_2))
+
+            logger.info(f"Saved metadata to {output_path}")
+            return output_path
+
+        except Exception as e:
+            raise ExtractionError(f"Failed to save metadata: {e}") from e
+
     def save_image(self, image_path: Path, destination_filename: str) -> Path:
         """Copy image to figures directory.
 
@@ -106,9 +145,11 @@ class OutputAssembler:
                 ensure_directory(self.figures_dir)
 
             output_path = self.figures_dir / destination_filename
-            with open(image_path, "rb") as src:
-                with open(output_path, "wb") as dst:
-                    dst.write(src.read())
+            # copyfile uses sendfile() where available, so the image never
+            # passes through a Python bytes buffer
+            shutil.copyfile(image_path, output_path)
+            if output_path.match("figure_*.png"):
+                self.figures_count += 1
 
             logger.debug(f"Saved image to {output_path}")
             # Return relative path for markdown linking
@@ -124,7 +165,7 @@ class OutputAssembler:
             error_msg: Error description.
         """
         self.metadata["errors"].append(error_msg)
-        logger.warning(f"Recorded error: {error_msg}")
+        logger.warning("Recorded error: {}", error_msg)
 
     def increment_pages(self, count: int = 1) -> None:
         """Increment processed page counter.
@@ -1,10 +1,29 @@
 """Configuration loading and validation."""
 
+import functools
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 import yaml
+from loguru import logger
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml-backed, much faster
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML config file, cached per path and modification time.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    # Names the loader in use, so a PyYAML build without libyaml is obvious
+    logger.debug("Parsing {} with yaml.{}", path, SafeLoader.__name__)
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
 
 
 @dataclass
@@ -13,6 +32,9 @@ class PDFConfig:
 
     dpi: int = 300
     max_pages: Optional[int] = None
+    workers: int = 1  # Processes rendering pages in parallel
+    image_format: Literal["png", "jpeg"] = "png"  # Page images sent to the model
+    use_text_layer: bool = False  # Use embedded PDF text instead of OCR where present
 
 
 @dataclass
@@ -23,6 +45,7 @@ class OllamaConfig:
     model: str = "ocrsuite-deepseek"  # Optimized DeepSeek-OCR with OCR parameters
     timeout: int = 600  # Increased to 10 minutes for complex documents
     max_retries: int = 3
+    parallelism: int = 1  # Concurrent page requests; match OLLAMA_NUM_PARALLEL
 
 
 @dataclass
@@ -56,6 +79,16 @@ class PostProcessConfig:
     canny_high: int = 150
 
 
+# Top-level YAML keys and the dataclass each one is loaded into
+_SECTIONS: tuple[tuple[str, type], ...] = (
+    ("pdf", PDFConfig),
+    ("ollama", OllamaConfig),
+    ("ocr", OCRConfig),
+    ("output", OutputConfig),
+    ("postprocess", PostProcessConfig),
+)
+
+
 @dataclass
 class Config:
     """Main configuration container."""
@@ -83,16 +116,7 @@ class Config:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(path, "r") as f:
-            data = yaml.safe_load(f) or {}
-
-        return cls(
-            pdf=PDFConfig(**data.get("pdf", {})),
-            ollama=OllamaConfig(**data.get("ollama", {})),
-            ocr=OCRConfig(**data.get("ocr", {})),
-            output=OutputConfig(**data.get("output", {})),
-            postprocess=PostProcessConfig(**data.get("postprocess", {})),
-        )
+        return cls.from_dict(_load_yaml(str(path), path.stat().st_mtime_ns))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Config":
@@ -104,13 +128,7 @@ class Config:
         Returns:
             Config instance.
         """
-        return cls(
-            pdf=PDFConfig(**data.get("pdf", {})),
-            ollama=OllamaConfig(**data.get("ollama", {})),
-            ocr=OCRConfig(**data.get("ocr", {})),
-            output=OutputConfig(**data.get("output", {})),
-            postprocess=PostProcessConfig(**data.get("postprocess", {})),
-        )
+        return cls(**{name: section(**data.get(name, {})) for name, section in _SECTIONS})
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary.
@@ -122,12 +140,16 @@ class Config:
             "pdf": {
                 "dpi": self.pdf.dpi,
                 "max_pages": self.pdf.max_pages,
+                "workers": self.pdf.workers,
+                "image_format": self.pdf.image_format,
+                "use_text_layer": self.pdf.use_text_layer,
             },
             "ollama": {
                 "url": self.ollama.url,
                 "model": self.ollama.model,
                 "timeout": self.ollama.timeout,
                 "max_retries": self.ollama.max_retries,
+                "parallelism": self.ollama.parallelism,
             },
             "ocr": {
                 "confidence_threshold": self.ocr.confidence_threshold,
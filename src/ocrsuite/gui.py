@@ -6,9 +6,11 @@ Commands:
 """
 
 import asyncio
+import os
 import shutil
 import tempfile
 import time
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -20,6 +22,7 @@ from nicegui import app, ui
 from .assembler import OutputAssembler
 from .config import Config
 from .ollama_client import OllamaClient
+from .pipeline import PageResult, extract_pages
 from .preprocessor import PDFPreprocessor
 from .utils import init_logging
 
@@ -310,37 +313,50 @@ def _disk_usage_str() -> str:
         return "unknown"
 
 
+def _list_output_files(directory: Path) -> list[dict]:
+    # DirEntry.is_file() is answered from the directory listing itself, so
+    # only the size lookup costs a stat() per file
+    with os.scandir(directory) as it:
+        entries = sorted(
+            (e for e in it if e.is_file() and e.name != "log.txt"), key=lambda e: e.name
+        )
+    return [{"name": e.name, "size_kb": round(e.stat().st_size / 1024, 1)} for e in entries]
+
+
 def _scan_sessions() -> list[dict]:
     sessions = []
     if not OUTPUT_ROOT.exists():
         return sessions
-    for entry in sorted(OUTPUT_ROOT.iterdir(), reverse=True):
-        if not entry.is_dir() or entry.name.startswith("."):
-            continue
+    with os.scandir(OUTPUT_ROOT) as it:
+        session_dirs = sorted(
+            (e for e in it if e.is_dir() and not e.name.startswith(".")),
+            key=lambda e: e.name,
+            reverse=True,
+        )
+    for entry in session_dirs:
         try:
             ts = datetime.strptime(entry.name, "%d%m%y_%H%M%S")
         except ValueError:
             continue
-        files = []
-        total_kb = 0
-        for f in sorted(entry.iterdir()):
-            if f.is_file() and f.name != "log.txt":
-                size_kb = round(f.stat().st_size / 1024, 1)
-                total_kb += size_kb
-                files.append({"name": f.name, "size_kb": size_kb})
+        files = _list_output_files(Path(entry.path))
         sessions.append(
             {
                 "id": entry.name,
                 "timestamp": ts,
-                "path": entry,
+                "path": Path(entry.path),
                 "files": files,
                 "file_count": len(files),
-                "total_kb": round(total_kb, 1),
+                "total_kb": round(sum(f["size_kb"] for f in files), 1),
             }
         )
     return sessions
 
 
+def _read_pdf_info(pdf_path: Path) -> dict:
+    with PDFPreprocessor() as preprocessor:
+        return preprocessor.get_pdf_info(pdf_path)
+
+
 # ── Pipeline (runs in asyncio.to_thread) ──────────────────
 def run_pipeline(pdf_path: Path, cfg: Config, out_dir: Path):
     global processing, progress
@@ -352,62 +368,74 @@ def run_pipeline(pdf_path: Path, cfg: Config, out_dir: Path):
     log_file = init_logging(out_dir, verbose=cfg.output.debug_mode)
     progress.log_path = log_file
     temp_dir = out_dir / ".temp_images"
+    resources = ExitStack()
 
     try:
         t0 = time.monotonic()
-        preprocessor = PDFPreprocessor(dpi=cfg.pdf.dpi)
+        preprocessor = resources.enter_context(
+            PDFPreprocessor(
+                dpi=cfg.pdf.dpi, workers=cfg.pdf.workers, image_format=cfg.pdf.image_format
+            )
+        )
         info = preprocessor.get_pdf_info(pdf_path)
         pages_to_process = info["page_count"]
         if cfg.pdf.max_pages:
             pages_to_process = min(cfg.pdf.max_pages, pages_to_process)
 
         progress.page_total = pages_to_process
-        images = preprocessor.pdf_to_images(pdf_path, temp_dir, max_pages=cfg.pdf.max_pages)
+        text_pages: dict[int, str] = {}
+        if cfg.pdf.use_text_layer:
+            text_pages = preprocessor.extract_text_layer(pdf_path, max_pages=cfg.pdf.max_pages)
+        images = list(
+            preprocessor.iter_pages(
+                pdf_path, temp_dir, max_pages=cfg.pdf.max_pages, skip_pages=text_pages.keys()
+            )
+        )
         progress.preprocess_s = round(time.monotonic() - t0, 1)
 
         progress.phase = "ocr"
-        client = OllamaClient(cfg.ollama)
+        client = resources.enter_context(OllamaClient(cfg.ollama))
         assembler = OutputAssembler(
             out_dir, source_filename=pdf_path.stem, debug=cfg.output.debug_mode
         )
 
-        extracted: list[dict] = []
+        # Pages are OCR'd concurrently (bounded by cfg.ollama.parallelism) and
+        # come back in page order
         total_s = 0.0
         n_req = 0
+        progress.pages_successful = len(text_pages)
+        progress.pages_done = len(text_pages)
 
-        for i, img in enumerate(images):
-            progress.page_current = i + 1
-            t_ocr = time.monotonic()
-
-            try:
-                text = client.ocr_image(img)
-                ok = text and text.strip() and "[Unrecognized" not in text
-                extracted.append(
-                    {
-                        "page": img.stem,
-                        "type": "text" if ok else "unknown",
-                        "content": text.strip() if text.strip() else "[Empty page]",
-                    }
-                )
-                assembler.increment_pages()
+        def report(page: PageResult) -> None:
+            nonlocal total_s, n_req
+            progress.page_current = page.index + 1
+            if page.error is None:
                 progress.pages_successful += 1
-            except Exception as e:
-                progress.errors.append(f"{img.name}: {e}")
-                assembler.record_error(f"{img.name}: {e}")
+            else:
+                progress.errors.append(f"{page.image_path.name}: {page.error}")
 
-            elapsed = time.monotonic() - t_ocr
-            progress.ollama_elapsed_s = round(elapsed, 1)
-            total_s += elapsed
+            progress.ollama_elapsed_s = round(page.elapsed_s, 1)
+            total_s += page.elapsed_s
             n_req += 1
             progress.ollama_avg_s = round(total_s / n_req, 1)
             progress.ollama_timeout = cfg.ollama.timeout
-            progress.pages_done = i + 1
+            progress.pages_done = len(text_pages) + n_req
+
+        extracted = extract_pages(
+            client,
+            images,
+            assembler,
+            text_pages=text_pages,
+            workers=cfg.ollama.parallelism,
+            keep_images=cfg.output.debug_mode,
+            on_page=report,
+        )
 
         progress.phase = "assembly"
-        md = "\n\n".join(
+        md_sections = (
             f"## {item['page']} ({item['type']})\n\n{item['content']}" for item in extracted
         )
-        assembler.save_markdown(md, title=pdf_path.stem.replace("_", " ").title())
+        assembler.save_markdown(md_sections, title=pdf_path.stem.replace("_", " ").title())
 
         if cfg.postprocess.enabled:
             progress.phase = "postprocess"
@@ -415,12 +443,14 @@ def run_pipeline(pdf_path: Path, cfg: Config, out_dir: Path):
                 from .config import OllamaConfig as OC
                 from .postprocessor import PostProcessor
 
-                pp_client = OllamaClient(
-                    OC(
-                        url=cfg.ollama.url,
-                        model=cfg.postprocess.model,
-                        timeout=cfg.ollama.timeout,
-                        max_retries=cfg.ollama.max_retries,
+                pp_client = resources.enter_context(
+                    OllamaClient(
+                        OC(
+                            url=cfg.ollama.url,
+                            model=cfg.postprocess.model,
+                            timeout=cfg.ollama.timeout,
+                            max_retries=cfg.ollama.max_retries,
+                        )
                     )
                 )
                 processor = PostProcessor(
@@ -444,10 +474,7 @@ def run_pipeline(pdf_path: Path, cfg: Config, out_dir: Path):
                 logger.warning(f"Post-processing failed: {e}")
                 progress.errors.append(f"postprocess: {e}")
 
-        files = []
-        for f in sorted(out_dir.iterdir()):
-            if f.is_file() and f.name != "log.txt":
-                files.append({"name": f.name, "size_kb": round(f.stat().st_size / 1024, 1)})
+        files = _list_output_files(out_dir)
         files.sort(key=lambda x: (not x["name"].endswith(".md"), x["name"]))
         progress.output_files = files
 
@@ -455,12 +482,14 @@ def run_pipeline(pdf_path: Path, cfg: Config, out_dir: Path):
         progress.errors.append(str(e))
 
     finally:
+        resources.close()
         progress.end_time = time.monotonic()
         if not cfg.output.debug_mode and temp_dir.exists():
             try:
                 shutil.rmtree(temp_dir)
             except Exception:
                 pass
+        logger.complete()
         progress.phase = "done"
         processing = False
 
@@ -570,9 +599,8 @@ def index():
                 size_mb = e.file.size() / (1024 * 1024)
 
                 try:
-                    from .preprocessor import PDFPreprocessor
-
-                    pinfo = PDFPreprocessor().get_pdf_info(uploaded_pdf)
+                    # Off the event loop: a running pipeline may hold the PDFium lock
+                    pinfo = await asyncio.to_thread(_read_pdf_info, uploaded_pdf)
                     page_count = pinfo["page_count"]
                 except Exception:
                     page_count = "?"
@@ -631,6 +659,16 @@ def index():
                 .props("outlined dense color=primary")
             )
 
+            parallel = (
+                ui.select(
+                    label="Parallel",
+                    options={1: 1, 2: 2, 4: 4, 8: 8},
+                    value=1,
+                )
+                .classes("w-28")
+                .props("outlined dense color=primary")
+            )
+
             debug_cb = ui.checkbox("Debug", value=False).props("dense color=primary")
 
         with ui.expansion("Advanced").props("dense color=primary").classes("w-full mt-2"):
@@ -667,6 +705,7 @@ def index():
         cfg.ollama.model = msel.value
         cfg.pdf.dpi = int(dpi.value)
         cfg.pdf.max_pages = mpages.value
+        cfg.ollama.parallelism = int(parallel.value)
         cfg.output.debug_mode = bool(debug_cb.value)
         cfg.postprocess.enabled = bool(post_cb.value)
         if post_cb.value:
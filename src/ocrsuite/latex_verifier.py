@@ -1,46 +1,88 @@
 """LaTeX verification and compilation utilities."""
 
+import functools
 import logging
+import re
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 from pylatexenc.latex2text import LatexNodes2Text
 
 logger = logging.getLogger(__name__)
 
+_TEXT_CONVERTER = LatexNodes2Text()
+
+# A % starts a comment running to the end of the line unless escaped as \%.
+# An even run of backslashes before it (e.g. the \\ line break) is kept.
+# Inside verbatim arguments (\url{...}, the target of \href{...}{...} and
+# \verb|...|) % is a literal character; those arguments are matched first so
+# that they are skipped as a whole.
+_COMMENT_RE = re.compile(
+    rb"(?P<verbatim>\\(?:url|href)\{[^}\n]*\}|\\verb\*?(?P<delim>[^\sa-zA-Z*]).*?(?P=delim))"
+    rb"|(?<!\\)(?P<escapes>(?:\\\\)*)%.*"
+)
+# \documentclass must be the first command; once comments are stripped only
+# whitespace may precede it
+_DOCCLASS_RE = re.compile(rb"\s*\\documentclass\b")
+
+
+def _strip_comments(data: bytes) -> bytes:
+    """Remove TeX comments, leaving verbatim arguments untouched."""
+    return _COMMENT_RE.sub(lambda m: m["verbatim"] or m["escapes"], data)
+
+
+def _delimiter_errors(source: bytes) -> list[str]:
+    """Report unbalanced braces and brackets in source."""
+    errors = []
+    chars = np.frombuffer(source, dtype=np.uint8)
+
+    # Count every byte value in a single pass instead of one str.count() scan
+    # per delimiter
+    counts = np.bincount(chars, minlength=256)
+
+    # Check for unmatched braces. Equal totals can still hide a closing brace
+    # that comes before its opening one, so follow the nesting depth as well.
+    open_braces = int(counts[ord("{")]) - int(counts[ord("}")])
+    if open_braces != 0:
+        errors.append(f"Unmatched braces (difference: {open_braces})")
+    elif counts[ord("}")]:
+        depth = np.cumsum((chars == ord("{")).astype(np.int32) - (chars == ord("}")))
+        if depth.min() < 0:
+            errors.append("Unmatched braces (closing brace before opening brace)")
+
+    # Check for unmatched brackets
+    open_brackets = int(counts[ord("[")]) - int(counts[ord("]")])
+    if open_brackets != 0:
+        errors.append(f"Unmatched brackets (difference: {open_brackets})")
+
+    return errors
+
 
 class LaTeXVerifier:
     """Verify and compile LaTeX documents."""
 
-    def __init__(self):
-        """Initialize verifier."""
-        self.has_pdflatex = self._check_pdflatex()
-        self.has_tectonic = self._check_tectonic()
+    # Compiler availability is probed on first use rather than on construction,
+    # so validation-only callers never spawn a subprocess.
+    @functools.cached_property
+    def has_pdflatex(self) -> bool:
+        """Whether pdflatex is available."""
+        return self._check_pdflatex()
+
+    @functools.cached_property
+    def has_tectonic(self) -> bool:
+        """Whether tectonic is available."""
+        return self._check_tectonic()
 
     def _check_pdflatex(self) -> bool:
         """Check if pdflatex is available."""
-        try:
-            result = subprocess.run(
-                ["pdflatex", "--version"],
-                capture_output=True,
-                timeout=5,
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        return shutil.which("pdflatex") is not None
 
     def _check_tectonic(self) -> bool:
         """Check if tectonic is available."""
-        try:
-            result = subprocess.run(
-                ["tectonic", "--version"],
-                capture_output=True,
-                timeout=5,
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        return shutil.which("tectonic") is not None
 
     def validate_latex_syntax(self, tex_path: Path) -> tuple[bool, list[str]]:
         """Validate LaTeX file syntax.
@@ -53,42 +95,39 @@ class LaTeXVerifier:
         """
         errors = []
 
-        if not tex_path.exists():
+        # One stat call, which also rejects directories before read_bytes()
+        if not tex_path.is_file():
             errors.append(f"File not found: {tex_path}")
             return False, errors
 
         try:
-            with open(tex_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            data = tex_path.read_bytes()
+            # Commands and delimiters inside comments do not count
+            stripped = _strip_comments(data)
 
             # Basic syntax checks
-            if not content.startswith("\\documentclass"):
+            if not _DOCCLASS_RE.match(stripped):
                 errors.append("Missing \\documentclass declaration")
 
-            if "\\begin{document}" not in content:
+            if b"\\begin{document}" not in stripped:
                 errors.append("Missing \\begin{document}")
 
-            if "\\end{document}" not in content:
+            if b"\\end{document}" not in stripped:
                 errors.append("Missing \\end{document}")
 
-            # Check for unmatched braces
-            open_braces = content.count("{") - content.count("}")
-            if open_braces != 0:
-                errors.append(f"Unmatched braces (difference: {open_braces})")
-
-            # Check for unmatched brackets
-            open_brackets = content.count("[") - content.count("]")
-            if open_brackets != 0:
-                errors.append(f"Unmatched brackets (difference: {open_brackets})")
+            errors.extend(_delimiter_errors(stripped))
 
-            # Try to extract text content
-            try:
-                converter = LatexNodes2Text()
-                text_content = converter.latex_to_text(content)
-                if not text_content.strip():
-                    logger.debug("Document appears to have no extractable text content")
-            except Exception as e:
-                logger.debug(f"Could not extract text content: {e}")
+            # Try to extract text content. The result is only reported at DEBUG
+            # level, so skip the full parse otherwise.
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    text_content = _TEXT_CONVERTER.latex_to_text(
+                        data.decode("utf-8", errors="replace")
+                    )
+                    if not text_content.strip():
+                        logger.debug("Document appears to have no extractable text content")
+                except Exception as e:
+                    logger.debug(f"Could not extract text content: {e}")
 
             return len(errors) == 0, errors
 
@@ -112,7 +151,7 @@ class LaTeXVerifier:
             return False, f"File not found: {tex_path}"
 
         if not output_path:
-            output_path = tex_path.parent / tex_path.stem / ".pdf"
+            output_path = tex_path.with_suffix(".pdf")
 
         # Try tectonic first (better for CI/CD, no dependencies)
         if self.has_tectonic:
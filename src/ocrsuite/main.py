@@ -1,8 +1,9 @@
 """Main CLI entry point for OCRSuite."""
 
 import shutil
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import typer
 from loguru import logger
@@ -13,6 +14,7 @@ from . import __version__
 from .assembler import OutputAssembler
 from .config import Config
 from .ollama_client import OllamaClient
+from .pipeline import PageResult, extract_pages
 from .postprocessor import PostProcessor
 from .preprocessor import PDFPreprocessor
 from .utils import OCRSuiteError, init_logging
@@ -91,7 +93,7 @@ def process(
         logger.info(f"Post-processing model override: {postprocess_model}")
 
     try:
-        with Progress(console=console) as progress:
+        with ExitStack() as resources, Progress(console=console) as progress:
             # Load configuration
             task_config = progress.add_task("[cyan]Loading configuration...", total=None)
             if config:
@@ -120,7 +122,7 @@ def process(
 
             # Check Ollama health
             task_ollama = progress.add_task("[cyan]Checking Ollama connection...", total=None)
-            client = OllamaClient(cfg.ollama)
+            client = resources.enter_context(OllamaClient(cfg.ollama))
             logger.info(f"Connecting to Ollama at {cfg.ollama.url}...")
             if not client.health_check():
                 progress.update(task_ollama, visible=False)
@@ -137,65 +139,78 @@ def process(
             console.print(f"[green]✓[/green] Connected to Ollama at {cfg.ollama.url}")
 
             # Preprocess PDF
-            task_preprocess = progress.add_task("[cyan]Converting PDF to images...", total=None)
-            preprocessor = PDFPreprocessor(dpi=cfg.pdf.dpi)
+            preprocessor = resources.enter_context(
+                PDFPreprocessor(
+                    dpi=cfg.pdf.dpi, workers=cfg.pdf.workers, image_format=cfg.pdf.image_format
+                )
+            )
             logger.info(f"Reading PDF: {input}")
             pdf_info = preprocessor.get_pdf_info(input)
             logger.info(f"PDF info: {pdf_info['page_count']} pages")
             console.print(f"[bold]PDF Info:[/bold] {pdf_info['page_count']} pages")
-
-            temp_images_dir = Path(output) / ".temp_images"
-            image_paths = preprocessor.pdf_to_images(
-                input, temp_images_dir, max_pages=cfg.pdf.max_pages
-            )
-            progress.update(task_preprocess, completed=True)
-            console.print(f"[green]✓[/green] Converted {len(image_paths)} pages to images")
+            pages_to_process = pdf_info["page_count"]
+            if cfg.pdf.max_pages:
+                pages_to_process = min(cfg.pdf.max_pages, pages_to_process)
 
             # Initialize output
             assembler = OutputAssembler(
                 Path(output), source_filename=input.stem, debug=cfg.output.debug_mode
             )
 
-            # Process each image with Ollama
+            text_pages: dict[int, str] = {}
+            if cfg.pdf.use_text_layer:
+                text_pages = preprocessor.extract_text_layer(input, max_pages=cfg.pdf.max_pages)
+                console.print(f"[green]✓[/green] Using embedded text for {len(text_pages)} pages")
+
+            pages_to_render = pages_to_process - len(text_pages)
+            task_preprocess = progress.add_task(
+                "[cyan]Converting PDF to images...", total=pages_to_render
+            )
             task_ocr = progress.add_task(
                 "[cyan]Extracting content with Ollama...",
-                total=len(image_paths),
+                total=pages_to_render,
             )
 
-            extracted_content = []
-            for image_path in image_paths:
-                try:
-                    # Always attempt direct OCR extraction
-                    # Classification doesn't work reliably with DeepSeek-OCR
-                    text = client.ocr_image(image_path)
-
-                    # Try to detect if response is actually meaningful
-                    # (vs placeholder text)
-                    if text and text.strip() and "[Unrecognized" not in text:
-                        content_type = "text"
-                    else:
-                        content_type = "unknown"
-                        logger.debug(f"Page {image_path.stem}: empty or placeholder OCR response")
-
-                    extracted_content.append(
-                        {
-                            "page": image_path.stem,
-                            "type": content_type,
-                            "content": text
-                            if text.strip()
-                            else "[Empty page or unrecognized content]",
-                        }
-                    )
-
-                    assembler.increment_pages()
-
-                except Exception as e:
-                    console.print(f"[yellow]⚠ Error processing {image_path.name}: {e}[/yellow]")
-                    logger.error(f"Error processing {image_path.name}: {e}", exc_info=verbose)
-                    assembler.record_error(f"{image_path.name}: {e}")
+            # Pages are rendered and OCR'd as a pipeline: each image is handed
+            # to the Ollama worker pool as soon as it is saved, while the next
+            # page renders. At most two images per OCR worker, plus two per
+            # render worker rendering ahead, wait on disk at once.
+            temp_images_dir = Path(output) / ".temp_images"
 
-                finally:
-                    progress.update(task_ocr, advance=1)
+            def rendered() -> Iterator[tuple[int, Path]]:
+                converted = 0
+                for page in preprocessor.iter_pages(
+                    input,
+                    temp_images_dir,
+                    max_pages=cfg.pdf.max_pages,
+                    skip_pages=text_pages.keys(),
+                ):
+                    converted += 1
+                    progress.update(task_preprocess, advance=1)
+                    yield page
+
+                progress.update(task_preprocess, total=converted, completed=converted)
+                progress.update(task_ocr, total=converted)
+                console.print(f"[green]✓[/green] Converted {converted} pages to images")
+
+            def report(page: PageResult) -> None:
+                if page.error is not None:
+                    name = page.image_path.name
+                    console.print(f"[yellow]⚠ Error processing {name}: {page.error}[/yellow]")
+                    logger.opt(exception=page.error if verbose else None).error(
+                        "Error processing {}: {}", name, page.error
+                    )
+                progress.update(task_ocr, advance=1)
+
+            extracted_content = extract_pages(
+                client,
+                rendered(),
+                assembler,
+                text_pages=text_pages,
+                workers=cfg.ollama.parallelism,
+                keep_images=cfg.output.debug_mode,
+                on_page=report,
+            )
 
             pages_processed = assembler.metadata["pages_processed"]
             errors_count = len(assembler.metadata["errors"])
@@ -206,13 +221,13 @@ def process(
 
             # Assemble single markdown output with linked figures
             logger.info("Assembling markdown output with linked figures...")
-            md_content = "\n\n".join(
+            md_sections = (
                 f"## {item['page']} ({item['type']})\n\n{item['content']}"
                 for item in extracted_content
             )
 
             output_file = assembler.save_markdown(
-                md_content,
+                md_sections,
                 title=input.stem.replace("_", " ").title(),
             )
             logger.info(f"✓ Markdown document saved: {output_file.name}")
@@ -226,12 +241,14 @@ def process(
                     "[cyan]Post-processing with vision model...", total=None
                 )
 
-                pp_client = OllamaClient(
-                    OllamaConfig(
-                        url=cfg.ollama.url,
-                        model=cfg.postprocess.model,
-                        timeout=cfg.ollama.timeout,
-                        max_retries=cfg.ollama.max_retries,
+                pp_client = resources.enter_context(
+                    OllamaClient(
+                        OllamaConfig(
+                            url=cfg.ollama.url,
+                            model=cfg.postprocess.model,
+                            timeout=cfg.ollama.timeout,
+                            max_retries=cfg.ollama.max_retries,
+                        )
                     )
                 )
                 processor = PostProcessor(
@@ -264,26 +281,24 @@ def process(
             console.print(f"[bold]Output Directory:[/bold] {Path(output).resolve()}")
             console.print("[bold]Output File:[/bold]")
             console.print(f"  - {output_file.name}")
-            figures_found = (
-                len(list((assembler.figures_dir or Path("/dev/null")).glob("figure_*.png")))
-                if assembler.figures_dir
-                else 0
-            )
-            if figures_found > 0:
-                console.print(f"  - {assembler.get_figures_dirname()}/ ({figures_found} figures)")
+            if assembler.figures_count > 0:
+                console.print(
+                    f"  - {assembler.get_figures_dirname()}/ ({assembler.figures_count} figures)"
+                )
 
     except OCRSuiteError as e:
-        logger.error(f"OCRSuite error: {e}", exc_info=verbose)
+        logger.opt(exception=verbose).error("OCRSuite error: {}", e)
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(code=1) from e
     except Exception as e:
-        logger.critical(f"Unexpected error: {e}", exc_info=True)
+        logger.opt(exception=True).critical("Unexpected error: {}", e)
         console.print(f"[red]Unexpected error:[/red] {e}")
         if verbose:
             console.print_exception()
         raise typer.Exit(code=1) from e
     finally:
         logger.info("OCRSuite process finished.")
+        logger.complete()
 
 
 @app.command()
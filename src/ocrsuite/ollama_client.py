@@ -1,15 +1,39 @@
 """Ollama integration for OCR and content recognition."""
 
 import base64
+import re
 import time
 from pathlib import Path
+from typing import Any, Optional
 
+import orjson
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
 from .config import OllamaConfig
 from .utils import OllamaError
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_TYPE_RE = re.compile(r"\b(text|table|figure|mixed|unknown)\b")
+
+# Fixed per-task prompts; identical prompt prefixes also let the server reuse
+# its cached prompt evaluation between pages
+_PROMPT_OCR = "Free OCR."
+_PROMPT_CLASSIFY = "<|grounding|>Given the layout of the image."
+_PROMPT_MATH = (
+    "Extract all mathematical formulas from this image and "
+    "convert them to LaTeX format. "
+    "Use $...$ for inline math and $$...$$ for display math. "
+    "Include any surrounding text that helps context."
+)
+_PROMPT_TABLE = (
+    "Extract the table from this image and convert it to "
+    "Markdown format. "
+    "Use | separators for columns and - for header rows. "
+    "Preserve all data accurately."
+)
+
 
 class OllamaClient:
     """Client for Ollama vision model integration."""
@@ -19,10 +43,29 @@ class OllamaClient:
         self.model = config.model
         self.timeout = config.timeout
         self.max_retries = config.max_retries
+        self._generate_url = f"{self.url}/api/generate"
+        self._tags_url = f"{self.url}/api/tags"
+        self._body_template: dict[str, Any] = {"model": self.model, "stream": False}
+        # One keep-alive connection per concurrent page request, instead of a
+        # new TCP connection for every call; retries are handled below
+        adapter = HTTPAdapter(pool_maxsize=max(1, config.parallelism), max_retries=0)
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def __enter__(self) -> "OllamaClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections to the Ollama server."""
+        self._session.close()
 
     def health_check(self) -> bool:
         try:
-            response = requests.get(f"{self.url}/api/tags", timeout=5)
+            response = self._session.get(self._tags_url, timeout=5)
             return response.status_code == 200
         except Exception:
             return False
@@ -31,64 +74,30 @@ class OllamaClient:
         if not image_path.exists():
             raise OllamaError(f"Image not found: {image_path}")
 
-        if not prompt:
-            prompt = "Free OCR."
-
-        return self._call_vision_model(image_path, prompt)
+        return self._call_vision_model(image_path, prompt or _PROMPT_OCR)
 
     def classify_content(self, image_path: Path) -> dict[str, str | float]:
-        prompt = "<|grounding|>Given the layout of the image."
-        response = self._call_vision_model(image_path, prompt).strip().lower()
-
-        valid_types = {"text", "table", "figure", "mixed", "unknown"}
-        content_type = "unknown"
-
-        if response in valid_types:
-            content_type = response
-        else:
-            for word in response.split():
-                word = word.strip(".,!?;:'\"").lower()
-                if word in valid_types:
-                    content_type = word
-                    logger.debug(f"Extracted '{word}' from response: '{response}'")
-                    break
+        response = self._call_vision_model(image_path, _PROMPT_CLASSIFY).strip().lower()
+
+        # First content type named anywhere in the reply, so explanatory
+        # answers ("This page is mostly a table.") still classify
+        match = _TYPE_RE.search(response)
+        content_type = match.group(1) if match else "unknown"
+        if match and content_type != response:
+            logger.debug("Extracted '{}' from response: '{}'", content_type, response)
 
         return {"type": content_type, "confidence": 0.8}
 
     def extract_math(self, image_path: Path) -> str:
-        prompt = (
-            "Extract all mathematical formulas from this image and "
-            "convert them to LaTeX format. "
-            "Use $...$ for inline math and $$...$$ for display math. "
-            "Include any surrounding text that helps context."
-        )
-        return self._call_vision_model(image_path, prompt)
+        return self._call_vision_model(image_path, _PROMPT_MATH)
 
     def extract_table(self, image_path: Path) -> str:
-        prompt = (
-            "Extract the table from this image and convert it to "
-            "Markdown format. "
-            "Use | separators for columns and - for header rows. "
-            "Preserve all data accurately."
-        )
-        return self._call_vision_model(image_path, prompt)
+        return self._call_vision_model(image_path, _PROMPT_TABLE)
 
     def generate_text(self, prompt: str) -> str:
         """Send a text-only prompt (no image) to the model."""
         try:
-            response = requests.post(
-                f"{self.url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                },
-                timeout=self.timeout,
-            )
-            if response.status_code != 200:
-                raise OllamaError(f"Ollama returned status {response.status_code}: {response.text}")
-            data = response.json()
-            return str(data.get("response", "")).strip()
+            return self._post_generate(prompt)
         except requests.ConnectionError as e:
             raise OllamaError(
                 f"Could not connect to Ollama at {self.url}. Is it running? Try: ollama serve"
@@ -98,27 +107,18 @@ class OllamaClient:
         except Exception as e:
             raise OllamaError(f"Ollama API call failed: {e}") from e
 
-    def _call_vision_model(self, image_path: Path, prompt: str, retry: int = 0) -> str:
+    def _call_vision_model(self, image_path: Path, prompt: str) -> str:
         try:
             image_data = self._encode_image(image_path)
+        except Exception as e:
+            raise OllamaError(f"Ollama API call failed: {e}") from e
 
-            response = requests.post(
-                f"{self.url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "images": [image_data],
-                    "stream": False,
-                },
-                timeout=self.timeout,
-            )
-
-            if response.status_code != 200:
-                raise OllamaError(f"Ollama returned status {response.status_code}: {response.text}")
+        # Retries reuse the encoded payload instead of re-reading the image
+        return self._generate_with_image(image_data, prompt)
 
-            data = response.json()
-            result = data.get("response", "")
-            return str(result).strip()
+    def _generate_with_image(self, image_data: bytes, prompt: str, retry: int = 0) -> str:
+        try:
+            return self._post_generate(prompt, image=image_data)
 
         except requests.ConnectionError as e:
             if retry < self.max_retries:
@@ -128,7 +128,7 @@ class OllamaClient:
                     f"(attempt {retry + 1}/{self.max_retries})"
                 )
                 time.sleep(wait_time)
-                return self._call_vision_model(image_path, prompt, retry + 1)
+                return self._generate_with_image(image_data, prompt, retry + 1)
             raise OllamaError(
                 f"Could not connect to Ollama at {self.url}. Is it running? Try: ollama serve"
             ) from e
@@ -139,7 +139,28 @@ class OllamaClient:
         except Exception as e:
             raise OllamaError(f"Ollama API call failed: {e}") from e
 
+    def _post_generate(self, prompt: str, image: Optional[bytes] = None) -> str:
+        body = orjson.dumps({**self._body_template, "prompt": prompt})
+        if image is not None:
+            # Base64 is already JSON-safe, so splice the encoded image into the
+            # body as-is instead of decoding it to str for the serializer
+            body = b"".join((body[:-1], b',"images":["', image, b'"]}'))
+
+        response = self._session.post(
+            self._generate_url,
+            data=body,
+            headers=_JSON_HEADERS,
+            timeout=self.timeout,
+        )
+
+        if response.status_code != 200:
+            raise OllamaError(f"Ollama returned status {response.status_code}: {response.text}")
+
+        data = orjson.loads(response.content)
+        return str(data.get("response", "")).strip()
+
     @staticmethod
-    def _encode_image(image_path: Path) -> str:
-        with open(image_path, "rb") as f:
-            return base64.b64encode(f.read()).decode("utf-8")
+    def _encode_image(image_path: Path) -> bytes:
+        # The raw bytes are released as soon as b64encode returns, so at most two
+        # copies of the payload are alive at once.
+        return base64.b64encode(image_path.read_bytes())
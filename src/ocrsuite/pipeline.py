@@ -0,0 +1,126 @@
+"""Page extraction shared by the CLI and the GUI.
+
+Rendered pages are OCR'd concurrently while later pages are still being
+rendered, and the results are put back into page order.
+"""
+
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from .assembler import OutputAssembler
+from .ollama_client import OllamaClient
+
+
+@dataclass
+class PageResult:
+    """Outcome of OCR for one page image."""
+
+    index: int  # Zero-based page index
+    image_path: Path
+    item: Optional[dict[str, str]]  # Extracted-content entry, None on error
+    error: Optional[Exception]
+    elapsed_s: float
+
+
+def ocr_page(client: OllamaClient, image_path: Path) -> dict[str, str]:
+    """Run OCR on one page image and build its extracted-content entry."""
+    # Always attempt direct OCR extraction
+    # Classification doesn't work reliably with DeepSeek-OCR
+    text = client.ocr_image(image_path)
+
+    # Try to detect if response is actually meaningful
+    # (vs placeholder text)
+    if text and text.strip() and "[Unrecognized" not in text:
+        content_type = "text"
+    else:
+        content_type = "unknown"
+        logger.debug("Page {}: empty or placeholder OCR response", image_path.stem)
+
+    return {
+        "page": image_path.stem,
+        "type": content_type,
+        "content": text if text.strip() else "[Empty page or unrecognized content]",
+    }
+
+
+def _timed_ocr_page(client: OllamaClient, index: int, image_path: Path) -> PageResult:
+    start = time.monotonic()
+    try:
+        item, error = ocr_page(client, image_path), None
+    except Exception as e:
+        item, error = None, e
+    return PageResult(index, image_path, item, error, time.monotonic() - start)
+
+
+def extract_pages(
+    client: OllamaClient,
+    pages: Iterable[tuple[int, Path]],
+    assembler: OutputAssembler,
+    text_pages: Optional[Mapping[int, str]] = None,
+    workers: int = 1,
+    keep_images: bool = False,
+    on_page: Optional[Callable[[PageResult], None]] = None,
+) -> list[dict[str, str]]:
+    """OCR rendered pages concurrently and return all entries in page order.
+
+    Each image is handed to the worker pool as soon as pages yields it. At most
+    two images per worker are waiting or in flight, so a lazy page iterator
+    never renders far ahead of the model. Page counts and errors are recorded
+    on the assembler from the calling thread only.
+
+    Args:
+        client: Ollama client shared by the workers.
+        pages: Zero-based page index and image path of each rendered page.
+        assembler: Receives the processed-page count and per-page errors.
+        text_pages: Text already taken from the PDF text layer, by page index.
+        workers: Pages OCR'd at the same time.
+        keep_images: If False, delete each image once its page is collected.
+        on_page: Called with each OCR result, in completion order.
+
+    Returns:
+        Extracted-content entries for text-layer and successfully OCR'd pages,
+        sorted by page index.
+    """
+    results: dict[int, dict[str, str]] = {}
+
+    # Pages with a usable text layer skip rendering and OCR entirely
+    for index, text in (text_pages or {}).items():
+        results[index] = {"page": f"page_{index + 1:04d}", "type": "text", "content": text}
+        assembler.increment_pages()
+
+    def collect(done: Iterable[Future[PageResult]]) -> None:
+        for future in done:
+            page = future.result()
+            if page.error is None and page.item is not None:
+                results[page.index] = page.item
+                assembler.increment_pages()
+            else:
+                assembler.record_error(f"{page.image_path.name}: {page.error}")
+            if not keep_images:
+                page.image_path.unlink(missing_ok=True)
+            if on_page is not None:
+                on_page(page)
+
+    workers = max(1, workers)
+    pending: set[Future[PageResult]] = set()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        remaining = iter(pages)
+        while True:
+            # Wait for room before pulling the next page, so that the iterator
+            # only renders it once a worker can take it soon
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            next_page = next(remaining, None)
+            if next_page is None:
+                break
+            pending.add(pool.submit(_timed_ocr_page, client, *next_page))
+        collect(as_completed(pending))
+
+    return [results[index] for index in sorted(results)]
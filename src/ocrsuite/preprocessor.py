@@ -1,30 +1,193 @@
 """PDF preprocessing and image conversion."""
 
+import multiprocessing
+import threading
+from collections import deque
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List
+from types import TracebackType
+from typing import Any, Iterator, List, Optional, TypeVar
 
-import pdfplumber
+import pypdfium2 as pdfium
 from loguru import logger
 
-from .utils import PreprocessingError, ensure_directory
+from .utils import ConfigError, PreprocessingError, ensure_directory
+
+# The page images are read back and base64-encoded for the model straight
+# away, so PNG spends as little time compressing as possible; JPEG keeps full
+# chroma resolution so small glyphs stay legible
+_IMAGE_SUFFIXES = {"png": ".png", "jpeg": ".jpg"}
+_SAVE_OPTIONS: dict[str, dict[str, Any]] = {
+    ".png": {"format": "PNG", "compress_level": 1, "optimize": False},
+    ".jpg": {"format": "JPEG", "quality": 90, "subsampling": 0},
+}
+
+# A text layer shorter than this, or mostly non-letters (page numbers, stray
+# glyphs from a bad scan layer), is not trusted over OCR
+MIN_TEXT_LAYER_CHARS = 50
+MIN_TEXT_LAYER_ALPHA_RATIO = 0.5
+
+# PDFium is not thread-safe and pypdfium2 does not serialize calls itself.
+# Every call into it within a process holds this lock, so e.g. the GUI can
+# read an uploaded file's info while a pipeline thread is rendering.
+_PDFIUM_LOCK = threading.Lock()
+
+# Per-process document for parallel rendering; each worker process opens its
+# own copy.
+_worker_pdf: Any = None
+
+
+def _open_document(pdf_path: Path) -> pdfium.PdfDocument:
+    with _PDFIUM_LOCK:
+        return pdfium.PdfDocument(pdf_path)
+
+
+def _close_document(pdf: pdfium.PdfDocument) -> None:
+    with _PDFIUM_LOCK:
+        pdf.close()
+
+
+def _init_render_worker(pdf_path: Path) -> None:
+    global _worker_pdf
+    _worker_pdf = _open_document(pdf_path)
+
+
+def _render_in_worker(task: tuple[int, float, Path]) -> Optional[str]:
+    page_index, scale, output_path = task
+    return _render_page(_worker_pdf, page_index, scale, output_path)
+
+
+def _render_page(
+    pdf: pdfium.PdfDocument, page_index: int, scale: float, output_path: Path
+) -> Optional[str]:
+    """Render one page to an image file. Returns an error message instead of raising."""
+    try:
+        with _PDFIUM_LOCK:
+            page = pdf[page_index]
+            try:
+                # Same settings pdfplumber's to_image() used, rendered from the
+                # already-open document instead of reopening the file per page
+                bitmap = page.render(
+                    scale=scale,
+                    no_smoothtext=True,
+                    no_smoothpath=True,
+                    no_smoothimage=True,
+                )
+                # convert() copies the pixels out of the PDFium-owned buffer
+                image = bitmap.to_pil().convert("RGB")
+                bitmap.close()
+            finally:
+                page.close()
+        # Encoding needs no PDFium state, so other threads may use it meanwhile
+        image.save(output_path, **_SAVE_OPTIONS[output_path.suffix])
+        return None
+    except Exception as e:
+        return str(e)
+
+
+def _page_text(pdf: pdfium.PdfDocument, page_index: int) -> str:
+    with _PDFIUM_LOCK:
+        page = pdf[page_index]
+        try:
+            textpage = page.get_textpage()
+            try:
+                text: str = textpage.get_text_range()
+            finally:
+                textpage.close()
+        finally:
+            page.close()
+    return text.replace("\r\n", "\n").strip()
+
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _map_bounded(
+    pool: Executor, fn: Callable[[_T], _R], items: Iterable[_T], window: int
+) -> Iterator[_R]:
+    """Like pool.map(), but with at most window items submitted and not yet yielded.
+
+    Executor.map() submits everything up front, so a slow consumer would let
+    the workers run arbitrarily far ahead.
+    """
+    remaining = iter(items)
+    pending: deque[Future[_R]] = deque(pool.submit(fn, item) for item in islice(remaining, window))
+    while pending:
+        result = pending.popleft().result()
+        pending.extend(pool.submit(fn, item) for item in islice(remaining, 1))
+        yield result
+
+
+def _is_usable_text(text: str) -> bool:
+    chars = [c for c in text if not c.isspace()]
+    if len(chars) < MIN_TEXT_LAYER_CHARS:
+        return False
+    return sum(c.isalpha() for c in chars) / len(chars) >= MIN_TEXT_LAYER_ALPHA_RATIO
 
 
 class PDFPreprocessor:
-    """Convert PDF pages to high-resolution images."""
+    """Convert PDF pages to high-resolution images.
 
-    def __init__(self, dpi: int = 300):
+    get_pdf_info() and extract_text_layer() keep the document open for the
+    following conversion. Use the preprocessor as a context manager, or call
+    close(), to release it when no conversion follows.
+    """
+
+    def __init__(self, dpi: int = 300, workers: int = 1, image_format: str = "png"):
         """Initialize preprocessor.
 
         Args:
             dpi: Resolution for image conversion.
+            workers: Processes used to render pages in parallel (1 renders in-process).
+            image_format: Page image format, "png" or "jpeg".
+
+        Raises:
+            ConfigError: If image_format is not supported.
         """
+        if image_format not in _IMAGE_SUFFIXES:
+            raise ConfigError(f"Unsupported image format: {image_format}")
         self.dpi = dpi
+        self.image_suffix = _IMAGE_SUFFIXES[image_format]
+        self.workers = max(1, workers)
         self.scale = dpi / 72.0  # Convert points to pixels
+        # Document opened by get_pdf_info(), handed on to the next conversion
+        self._document: Optional[tuple[Path, pdfium.PdfDocument]] = None
+
+    def __enter__(self) -> "PDFPreprocessor":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the document kept open by get_pdf_info() or extract_text_layer()."""
+        if self._document is not None:
+            _, pdf = self._document
+            self._document = None
+            _close_document(pdf)
+
+    def _open(self, pdf_path: Path) -> pdfium.PdfDocument:
+        """Open pdf_path, reusing the document left open by get_pdf_info()."""
+        if self._document is not None:
+            path, pdf = self._document
+            self._document = None
+            if path == pdf_path:
+                return pdf
+            _close_document(pdf)
+        return _open_document(pdf_path)
 
     def pdf_to_images(
         self, pdf_path: Path, output_dir: Path, max_pages: int | None = None
     ) -> List[Path]:
-        """Convert PDF pages to PNG images.
+        """Convert PDF pages to images.
 
         Args:
             pdf_path: Path to input PDF file.
@@ -34,6 +197,51 @@ class PDFPreprocessor:
         Returns:
             List of paths to generated image files.
 
+        Raises:
+            PreprocessingError: If PDF processing fails.
+        """
+        return list(self.iter_images(pdf_path, output_dir, max_pages=max_pages))
+
+    def iter_images(
+        self, pdf_path: Path, output_dir: Path, max_pages: int | None = None
+    ) -> Iterator[Path]:
+        """Convert PDF pages to images, yielding each path as soon as it is saved.
+
+        Lets callers start working on early pages while later ones are still
+        being rendered.
+
+        Args:
+            pdf_path: Path to input PDF file.
+            output_dir: Directory for output images.
+            max_pages: Maximum pages to convert (None for all).
+
+        Yields:
+            Path to each generated image file, in page order.
+
+        Raises:
+            PreprocessingError: If PDF processing fails.
+        """
+        for _, image_path in self.iter_pages(pdf_path, output_dir, max_pages=max_pages):
+            yield image_path
+
+    def iter_pages(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        max_pages: int | None = None,
+        skip_pages: Collection[int] = (),
+    ) -> Iterator[tuple[int, Path]]:
+        """Convert PDF pages to images, yielding each page index and image path.
+
+        Args:
+            pdf_path: Path to input PDF file.
+            output_dir: Directory for output images.
+            max_pages: Maximum pages to convert (None for all).
+            skip_pages: Zero-based indices of pages not to render.
+
+        Yields:
+            Zero-based page index and path of each generated image, in page order.
+
         Raises:
             PreprocessingError: If PDF processing fails.
         """
@@ -41,41 +249,71 @@ class PDFPreprocessor:
             raise PreprocessingError(f"PDF file not found: {pdf_path}")
 
         ensure_directory(output_dir)
-        image_paths = []
+        converted = 0
 
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                total_pages = len(pdf.pages)
+            pdf = self._open(pdf_path)
+            try:
+                with _PDFIUM_LOCK:
+                    total_pages = len(pdf)
                 pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
+                page_nums = [n for n in range(pages_to_process) if n not in skip_pages]
 
-                logger.info(f"Converting {pages_to_process} pages from {pdf_path.name}")
+                logger.info(f"Converting {len(page_nums)} pages from {pdf_path.name}")
 
-                for page_num, page in enumerate(pdf.pages[:pages_to_process]):
-                    try:
-                        # Render page as image
-                        image = page.to_image(resolution=self.dpi).original
-
-                        # Save image
-                        output_path = output_dir / f"page_{page_num + 1:04d}.png"
-                        image.save(output_path, "PNG")
-                        image_paths.append(output_path)
+                output_paths = {
+                    page_num: output_dir / f"page_{page_num + 1:04d}{self.image_suffix}"
+                    for page_num in page_nums
+                }
+                pool = None
+                failures: Iterable[Optional[str]]
+                if self.workers > 1 and page_nums:
+                    # Results come back in page order while later pages keep
+                    # rendering, at most two pages per worker ahead of the caller
+                    pool = ProcessPoolExecutor(
+                        max_workers=min(self.workers, len(page_nums)),
+                        # OCR threads may already be running; never fork them
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_render_worker,
+                        initargs=(pdf_path,),
+                    )
+                    failures = _map_bounded(
+                        pool,
+                        _render_in_worker,
+                        ((n, self.scale, output_paths[n]) for n in page_nums),
+                        window=2 * self.workers,
+                    )
+                else:
+                    failures = (
+                        _render_page(pdf, n, self.scale, output_paths[n]) for n in page_nums
+                    )
 
-                        logger.debug(f"Processed page {page_num + 1}/{pages_to_process}")
+                try:
+                    for page_num, failure in zip(page_nums, failures, strict=True):
+                        if failure is not None:
+                            logger.warning("Failed to process page {}: {}", page_num + 1, failure)
+                            continue
 
-                    except Exception as e:
-                        logger.warning(f"Failed to process page {page_num + 1}: {e}")
-                        continue
+                        logger.debug("Processed page {}/{}", page_num + 1, pages_to_process)
+                        converted += 1
+                        yield page_num, output_paths[page_num]
+                finally:
+                    if pool is not None:
+                        pool.shutdown(cancel_futures=True)
 
-                logger.info(f"Successfully converted {len(image_paths)}/{pages_to_process} pages")
+                logger.info(f"Successfully converted {converted}/{len(page_nums)} pages")
+            finally:
+                _close_document(pdf)
 
         except Exception as e:
             raise PreprocessingError(f"PDF processing failed: {e}") from e
 
-        return image_paths
-
     def get_pdf_info(self, pdf_path: Path) -> dict:
         """Extract PDF metadata.
 
+        The document stays open for a following pdf_to_images() or iter_images()
+        call on the same file, so it is only parsed once.
+
         Args:
             pdf_path: Path to PDF file.
 
@@ -89,10 +327,57 @@ class PDFPreprocessor:
             raise PreprocessingError(f"PDF file not found: {pdf_path}")
 
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                return {
-                    "page_count": len(pdf.pages),
-                    "metadata": pdf.metadata or {},
-                }
+            pdf = self._open(pdf_path)
+            try:
+                with _PDFIUM_LOCK:
+                    info = {
+                        "page_count": len(pdf),
+                        "metadata": pdf.get_metadata_dict(skip_empty=True),
+                    }
+            except Exception:
+                _close_document(pdf)
+                raise
+            self._document = (pdf_path, pdf)
+            return info
         except Exception as e:
             raise PreprocessingError(f"Failed to read PDF info: {e}") from e
+
+    def extract_text_layer(self, pdf_path: Path, max_pages: int | None = None) -> dict[int, str]:
+        """Read embedded text from pages that already carry a usable text layer.
+
+        Like get_pdf_info(), leaves the document open for the following
+        conversion, which can skip the returned pages.
+
+        Args:
+            pdf_path: Path to PDF file.
+            max_pages: Maximum pages to inspect (None for all).
+
+        Returns:
+            Mapping of zero-based page index to extracted text, for pages whose
+            text layer is long enough and mostly letters.
+
+        Raises:
+            PreprocessingError: If PDF processing fails.
+        """
+        if not pdf_path.exists():
+            raise PreprocessingError(f"PDF file not found: {pdf_path}")
+
+        try:
+            pdf = self._open(pdf_path)
+            try:
+                with _PDFIUM_LOCK:
+                    total_pages = len(pdf)
+                pages_to_check = min(max_pages, total_pages) if max_pages else total_pages
+                texts = {}
+                for page_num in range(pages_to_check):
+                    text = _page_text(pdf, page_num)
+                    if _is_usable_text(text):
+                        texts[page_num] = text
+            except Exception:
+                _close_document(pdf)
+                raise
+            self._document = (pdf_path, pdf)
+            logger.info(f"Text layer found on {len(texts)}/{pages_to_check} pages")
+            return texts
+        except Exception as e:
+            raise PreprocessingError(f"Failed to read PDF text layer: {e}") from e
@@ -1,5 +1,6 @@
 """Utilities: logging configuration, error handling, and common operations."""
 
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -11,6 +12,7 @@ def init_logging(output_dir: Path, verbose: bool = False) -> Path:
     """Configure loguru for OCRSuite with ISO 8601 timestamps.
 
     Sets up dual output: file (full detail) and stderr (colorized, concise).
+    File writes are queued; call ``logger.complete()`` before reading the log.
     Returns the path to the log file.
     """
     output_dir = ensure_directory(output_dir)
@@ -26,6 +28,9 @@ def init_logging(output_dir: Path, verbose: bool = False) -> Path:
         rotation="10 MB",
         retention="7 days",
         encoding="utf-8",
+        # Writes happen on loguru's background thread, so OCR worker threads
+        # never wait on disk I/O while holding the sink lock
+        enqueue=True,
     )
 
     logger.add(
@@ -64,8 +69,18 @@ class ExtractionError(OCRSuiteError):
 
 
 def ensure_directory(path: Path) -> Path:
+    # Usually the directory is already there: answer that with one stat()
+    fspath = os.fspath(path)
+    if os.path.isdir(fspath):
+        return path
     try:
-        path.mkdir(parents=True, exist_ok=True)
+        try:
+            os.mkdir(fspath)
+        except FileNotFoundError:  # missing parents
+            os.makedirs(fspath, exist_ok=True)
+        except FileExistsError:  # created concurrently, or a file is in the way
+            if not os.path.isdir(fspath):
+                raise
         return path
     except OSError as e:
         raise OCRSuiteError(f"Failed to create directory {path}: {e}") from e
@@ -1,8 +1,34 @@
 """Shared fixtures for OCRSuite tests."""
 
+import sys
 from pathlib import Path
 
 import pytest
+from loguru import logger
+
+
+def _build_pdf(objects: list[bytes], trailer: bytes = b"") -> bytes:
+    """Serialize numbered objects (catalog first) into a PDF with a valid xref table."""
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for num, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += b"%d 0 obj" % num + obj + b"endobj\n"
+    xref = len(body)
+    body += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    body += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    body += b"trailer<</Size %d/Root 1 0 R%s>>\n" % (len(objects) + 1, trailer)
+    body += b"startxref\n%d\n%%%%EOF\n" % xref
+    return body
+
+
+@pytest.fixture
+def restore_logging():
+    """Undo init_logging(): drop its sinks and reinstate loguru's default stderr sink."""
+    yield
+    # remove() drains the enqueued file sink and stops its writer thread
+    logger.remove()
+    logger.add(sys.stderr)
 
 
 @pytest.fixture
@@ -21,6 +47,63 @@ def sample_pdf(tmp_path: Path) -> Path:
     return pdf_path
 
 
+@pytest.fixture(scope="session")
+def minimal_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a header-only PDF (no body) that PDF readers reject."""
+    pdf_path = tmp_path_factory.mktemp("pdf") / "test.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n")
+    return pdf_path
+
+
+@pytest.fixture
+def text_pdf(tmp_path: Path) -> Path:
+    """Create a two-page PDF: a page with a text layer, then a blank page."""
+    text = b"The quick brown fox jumps over the lazy dog near the riverbank."
+    stream = b"BT /F1 12 Tf 72 700 Td (" + text + b") Tj ET"
+    objects = [
+        b"<</Type/Catalog/Pages 2 0 R>>",
+        b"<</Type/Pages/Kids[3 0 R 5 0 R]/Count 2>>",
+        b"<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]"
+        b"/Resources<</Font<</F1 6 0 R>>>>/Contents 4 0 R>>",
+        b"<</Length %d>>stream\n" % len(stream) + stream + b"\nendstream",
+        b"<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>",
+        b"<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>",
+    ]
+    pdf_path = tmp_path / "text.pdf"
+    pdf_path.write_bytes(_build_pdf(objects))
+    return pdf_path
+
+
+@pytest.fixture
+def multipage_pdf(tmp_path: Path) -> Path:
+    """Create an eight-page PDF of small blank pages."""
+    page_count = 8
+    kids = b" ".join(b"%d 0 R" % (3 + n) for n in range(page_count))
+    objects = [
+        b"<</Type/Catalog/Pages 2 0 R>>",
+        b"<</Type/Pages/Kids[" + kids + b"]/Count %d>>" % page_count,
+    ]
+    objects += [b"<</Type/Page/Parent 2 0 R/MediaBox[0 0 144 144]>>"] * page_count
+    pdf_path = tmp_path / "multipage.pdf"
+    pdf_path.write_bytes(_build_pdf(objects))
+    return pdf_path
+
+
+@pytest.fixture
+def metadata_pdf(tmp_path: Path) -> Path:
+    """Create a one-page PDF whose Info dictionary mixes standard, empty and custom keys."""
+    objects = [
+        b"<</Type/Catalog/Pages 2 0 R>>",
+        b"<</Type/Pages/Kids[3 0 R]/Count 1>>",
+        b"<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>",
+        b"<</Title(Old Book)/Author(A. Writer)/Subject()"
+        b"/CreationDate(D:19990101000000Z)/Scanner(Acme 3000)/Trapped/False>>",
+    ]
+    pdf_path = tmp_path / "metadata.pdf"
+    pdf_path.write_bytes(_build_pdf(objects, trailer=b"/Info 4 0 R"))
+    return pdf_path
+
+
 @pytest.fixture
 def sample_image(tmp_path: Path) -> Path:
     """Create a small test PNG image readable by OpenCV."""
@@ -1,5 +1,7 @@
 """Tests for output assembler module."""
 
+import json
+
 from ocrsuite.assembler import OutputAssembler
 
 
@@ -23,6 +25,46 @@ def test_save_markdown_custom_filename(temp_output_dir):
     assert path.read_text(encoding="utf-8") == "Hello"
 
 
+def test_save_markdown_sections(temp_output_dir):
+    assembler = OutputAssembler(temp_output_dir, source_filename="testdoc")
+    sections = (f"## page_{n}" for n in range(1, 4))
+    path = assembler.save_markdown(sections, filename="sections.md")
+
+    assert path.read_text(encoding="utf-8") == "## page_1\n\n## page_2\n\n## page_3"
+
+
+def test_save_markdown_processing_notes(temp_output_dir):
+    assembler = OutputAssembler(temp_output_dir, source_filename="testdoc")
+    assembler.increment_pages(2)
+    assembler.record_error("page_0001.png: timeout")
+    assembler.record_error("page_0002.png: empty")
+    path = assembler.save_markdown("Body", filename="notes.md")
+
+    assert path.read_text(encoding="utf-8") == (
+        "Body\n---\n"
+        "## Processing Notes\n"
+        "- Pages processed: 2\n"
+        "- Errors: 2\n"
+        "  - page_0001.png: timeout\n"
+        "  - page_0002.png: empty\n"
+    )
+
+
+def test_save_metadata_json(temp_output_dir):
+    assembler = OutputAssembler(temp_output_dir, source_filename="testdoc")
+    assembler.increment_pages(3)
+    assembler.record_error("page_0002.png: timeout")
+    path = assembler.save_metadata_json()
+
+    assert path.name == "metadata.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data == {
+        "created": assembler.created_dt.isoformat(),
+        "pages_processed": 3,
+        "errors": ["page_0002.png: timeout"],
+    }
+
+
 def test_record_error(temp_output_dir):
     assembler = OutputAssembler(temp_output_dir)
     assembler.record_error("Something went wrong")
@@ -67,3 +109,13 @@ def test_save_image(sample_image, temp_output_dir):
     assert assembler.figures_dir.exists()
     saved = assembler.figures_dir / "fig_01.png"
     assert saved.exists()
+
+
+def test_figures_count(sample_image, temp_output_dir):
+    assembler = OutputAssembler(temp_output_dir, source_filename="testdoc")
+    assert assembler.figures_count == 0
+
+    assembler.save_image(sample_image, "figure_001.png")
+    assembler.save_image(sample_image, "figure_002.png")
+    assembler.save_image(sample_image, "cover.png")
+    assert assembler.figures_count == 2
@@ -1,8 +1,15 @@
 """Tests for CLI entry point."""
 
+import re
+import threading
+import time
+
+import pytest
 from typer.testing import CliRunner
 
+from ocrsuite.assembler import OutputAssembler
 from ocrsuite.main import app
+from ocrsuite.utils import OllamaError
 
 runner = CliRunner()
 
@@ -29,3 +36,109 @@ def test_cli_process_missing_input():
 def test_cli_process_no_input():
     result = runner.invoke(app, ["process"])
     assert result.exit_code != 0
+
+
+def test_cli_process_records_page_error(sample_pdf, tmp_path, mocker, restore_logging):
+    mocker.patch("ocrsuite.main.OllamaClient.health_check", return_value=True)
+    mocker.patch(
+        "ocrsuite.main.OllamaClient.ocr_image",
+        side_effect=OllamaError('Ollama returned status 500: {"error":"model not found"}'),
+    )
+    output = tmp_path / "out"
+
+    result = runner.invoke(app, ["process", "--input", str(sample_pdf), "--output", str(output)])
+
+    assert result.exit_code == 0, result.stdout
+    markdown = next(output.glob("*.md")).read_text()
+    assert '{"error":"model not found"}' in markdown
+
+
+def _run_parallel_process(pdf_path, tmp_path, mocker, ocr_image):
+    """Run the process command with three OCR workers and capture its assembler."""
+    mocker.patch("ocrsuite.main.OllamaClient.health_check", return_value=True)
+    mocker.patch("ocrsuite.main.OllamaClient.ocr_image", side_effect=ocr_image)
+    assemblers = []
+    mocker.patch(
+        "ocrsuite.main.OutputAssembler",
+        side_effect=lambda *args, **kwargs: (
+            assemblers.append(OutputAssembler(*args, **kwargs)) or assemblers[-1]
+        ),
+    )
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("pdf:\n  dpi: 36\nollama:\n  parallelism: 3\n")
+    output = tmp_path / "out"
+
+    result = runner.invoke(
+        app,
+        [
+            "process",
+            "--input",
+            str(pdf_path),
+            "--output",
+            str(output),
+            "--config",
+            str(config_path),
+        ],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    return output, assemblers[0]
+
+
+def test_cli_process_parallel_keeps_page_order(multipage_pdf, tmp_path, mocker, restore_logging):
+    """Pages finishing out of order are written in page order; a failed page is only recorded."""
+    last_page_done = threading.Event()
+    finished = []
+
+    def ocr_image(image_path):
+        # Later pages finish first: each waits less, and page 1 waits for page 8
+        index = int(image_path.stem.split("_")[1])
+        if index == 1:
+            assert last_page_done.wait(timeout=10)
+        else:
+            time.sleep((8 - index) * 0.01)
+        finished.append(index)
+        if index == 8:
+            last_page_done.set()
+        if index == 5:
+            raise OllamaError("boom")
+        return f"text of page {index}"
+
+    output, assembler = _run_parallel_process(multipage_pdf, tmp_path, mocker, ocr_image)
+
+    assert finished != sorted(finished)
+    markdown = next(output.glob("*.md")).read_text()
+    sections = re.findall(r"^## (page_\d{4})", markdown, flags=re.MULTILINE)
+    assert sections == [f"page_{n:04d}" for n in (1, 2, 3, 4, 6, 7, 8)]
+    assert assembler.metadata["errors"] == ["page_0005.png: boom"]
+    assert assembler.metadata["pages_processed"] == 7
+
+
+def test_cli_process_bounds_temp_images(multipage_pdf, tmp_path, mocker, restore_logging):
+    """Rendering stays within the OCR window and each image is deleted with its page."""
+    temp_images = tmp_path / "out" / ".temp_images"
+    on_disk = []
+
+    def ocr_image(image_path):
+        on_disk.append(len(list(temp_images.iterdir())))
+        time.sleep(0.01)
+        return "text"
+
+    # Keep the final cleanup from hiding images the per-page deletion missed
+    rmtree = mocker.patch("ocrsuite.main.shutil.rmtree")
+
+    _run_parallel_process(multipage_pdf, tmp_path, mocker, ocr_image)
+
+    assert len(on_disk) == 8
+    # Three OCR workers, two pages each; pdf.workers=1 renders nothing ahead
+    assert max(on_disk) <= 2 * 3
+    rmtree.assert_called_once_with(temp_images, ignore_errors=True)
+    assert list(temp_images.iterdir()) == []
+
+
+def test_package_exports_app_lazily():
+    import ocrsuite
+
+    assert ocrsuite.app is app
+    with pytest.raises(AttributeError):
+        ocrsuite.missing_attribute  # noqa: B018
@@ -1,11 +1,34 @@
 """Tests for configuration module."""
 
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
+import yaml
+from loguru import logger
 
-from ocrsuite.config import Config
+from ocrsuite.config import Config, SafeLoader
+
+YAML_FIXTURE = """
+pdf:
+  dpi: 400
+  max_pages: 10
+ollama:
+  model: deepseek-ocr
+  timeout: 180
+ocr:
+  extract_math: true
+output:
+  debug_mode: true
+"""
+
+
+@pytest.fixture(scope="module")
+def config_file(tmp_path_factory):
+    """YAML config written once for the tests that only read it."""
+    path = tmp_path_factory.mktemp("config") / "config.yaml"
+    path.write_bytes(YAML_FIXTURE.encode("utf-8"))
+    return path
 
 
 def test_config_defaults():
@@ -14,6 +37,10 @@ def test_config_defaults():
     assert config.pdf.dpi == 300
     assert config.ollama.url == "http://localhost:11434"
     assert config.ollama.model == "ocrsuite-deepseek"
+    assert config.pdf.workers == 1
+    assert config.pdf.image_format == "png"
+    assert config.pdf.use_text_layer is False
+    assert config.ollama.parallelism == 1
     assert config.ocr.confidence_threshold == 0.5
 
 
@@ -39,31 +66,45 @@ def test_config_to_dict():
     assert "output" in data
 
 
-def test_config_from_yaml_file():
+def test_config_from_yaml_file(config_file):
     """Test loading config from YAML file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "config.yaml"
-        config_path.write_text(
-            """
-pdf:
-  dpi: 400
-  max_pages: 10
-ollama:
-  model: deepseek-ocr
-  timeout: 180
-ocr:
-  extract_math: true
-output:
-  debug_mode: true
-"""
-        )
-
-        config = Config.from_file(config_path)
-        assert config.pdf.dpi == 400
-        assert config.pdf.max_pages == 10
-        assert config.ollama.model == "deepseek-ocr"
-        assert config.ollama.timeout == 180
-        assert config.output.debug_mode is True
+    config = Config.from_file(config_file)
+    assert config.pdf.dpi == 400
+    assert config.pdf.max_pages == 10
+    assert config.ollama.model == "deepseek-ocr"
+    assert config.ollama.timeout == 180
+    assert config.output.debug_mode is True
+
+
+def test_config_from_file_matches_from_dict(config_file):
+    """Test the fast YAML loader builds the same config as the reference parser."""
+    assert Config.from_file(config_file) == Config.from_dict(yaml.safe_load(YAML_FIXTURE))
+
+
+def test_config_from_file_logs_yaml_loader(tmp_path):
+    """Test the YAML loader in use is reported when a file is parsed."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("pdf:\n  dpi: 150\n")
+    messages: list[str] = []
+    sink_id = logger.add(messages.append, level="DEBUG", format="{message}")
+    try:
+        Config.from_file(config_path)
+    finally:
+        logger.remove(sink_id)
+
+    assert any(f"with yaml.{SafeLoader.__name__}" in m for m in messages)
+
+
+def test_config_from_file_reloads_on_change(tmp_path):
+    """Test cached YAML is re-read once the file is modified."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("pdf:\n  dpi: 200\n")
+    assert Config.from_file(config_path).pdf.dpi == 200
+
+    config_path.write_text("pdf:\n  dpi: 600\n")
+    mtime_ns = config_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_path, ns=(mtime_ns, mtime_ns))
+    assert Config.from_file(config_path).pdf.dpi == 600
 
 
 def test_config_file_not_found():
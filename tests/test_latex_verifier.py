@@ -1,66 +1,142 @@
 """Tests for LaTeX verification module."""
 
-import tempfile
+import logging
 from pathlib import Path
 
+import pytest
+
 from ocrsuite.latex_verifier import LaTeXVerifier
 
 
 def test_latex_verifier_initialization():
     """Test LaTeX verifier initialization."""
-    verifier = LaTeXVerifier()
-    assert verifier is not None
-    # Check methods exist
-    assert hasattr(verifier, "validate_latex_syntax")
-    assert hasattr(verifier, "compile_to_pdf")
+    assert callable(LaTeXVerifier().validate_latex_syntax)
 
 
-def test_validate_valid_latex():
-    """Test validation of valid LaTeX."""
-    verifier = LaTeXVerifier()
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tex_file = Path(tmpdir) / "test.tex"
-        tex_file.write_text(
-            "\\documentclass{article}\n\\begin{document}\nHello, World!\n\\end{document}\n"
-        )
-        is_valid, errors = verifier.validate_latex_syntax(tex_file)
-        assert is_valid, f"LaTeX validation failed with errors: {errors}"
-        assert len(errors) == 0
-
-
-def test_validate_missing_documentclass():
-    """Test validation detects missing documentclass."""
-    verifier = LaTeXVerifier()
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tex_file = Path(tmpdir) / "test.tex"
-        tex_file.write_text(
-            r"""
-\begin{document}
-Hello
-\end{document}
-"""
-        )
-        is_valid, errors = verifier.validate_latex_syntax(tex_file)
-        assert not is_valid
-        assert any("documentclass" in e.lower() for e in errors)
-
-
-def test_validate_unmatched_braces():
-    """Test validation detects unmatched braces."""
+def test_compiler_detection_is_lazy(mocker):
+    """Test compilers are probed on first access only, and only once."""
+    mock_which = mocker.patch(
+        "ocrsuite.latex_verifier.shutil.which", return_value="/usr/bin/tectonic"
+    )
+
     verifier = LaTeXVerifier()
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tex_file = Path(tmpdir) / "test.tex"
-        tex_file.write_text(
-            r"""
-\documentclass{article}
-\begin{document}
-Hello {world
-\end{document}
-"""
-        )
-        is_valid, errors = verifier.validate_latex_syntax(tex_file)
-        assert not is_valid
-        assert any("brace" in e.lower() for e in errors)
+    mock_which.assert_not_called()
+
+    assert verifier.has_tectonic
+    assert verifier.has_tectonic
+    mock_which.assert_called_once_with("tectonic")
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    return LaTeXVerifier()
+
+
+@pytest.mark.parametrize(
+    ("body", "valid", "needle"),
+    [
+        pytest.param(
+            "\\documentclass{article}\n\\begin{document}\nHello, World!\n\\end{document}\n",
+            True,
+            None,
+            id="valid",
+        ),
+        pytest.param(
+            "\n\\begin{document}\nHello\n\\end{document}\n",
+            False,
+            "documentclass",
+            id="missing-documentclass",
+        ),
+        pytest.param(
+            "% !TEX program = pdflatex\n\n\\documentclass{article}\n"
+            "\\begin{document}\nHello\n\\end{document}\n",
+            True,
+            None,
+            id="documentclass-after-comment",
+        ),
+        pytest.param(
+            "% \\documentclass{article}\n\\begin{document}\nHello\n\\end{document}\n",
+            False,
+            "documentclass",
+            id="commented-out-documentclass",
+        ),
+        pytest.param(
+            "\n\\documentclass{article}\n\\begin{document}\nHello {world\n\\end{document}\n",
+            False,
+            "brace",
+            id="unmatched-braces",
+        ),
+        pytest.param(
+            "\\documentclass{article}\n\\begin{document}\nHello }world{\n\\end{document}\n",
+            False,
+            "brace",
+            id="closing-brace-first",
+        ),
+        pytest.param(
+            "\\documentclass{article}\n\\begin{document}\n"
+            "50\\% {off} % stray } in a comment\n\\end{document}\n",
+            True,
+            None,
+            id="brace-in-comment",
+        ),
+        pytest.param(
+            "\\documentclass{article}\n\\begin{document}\n"
+            "Line\\\\% a real comment after a line break }\n\\end{document}\n",
+            True,
+            None,
+            id="comment-after-line-break",
+        ),
+        pytest.param(
+            "\\documentclass{article}\n\\begin{document}\n"
+            "See \\url{http://example.com/a%20b}.\n\\end{document}\n",
+            True,
+            None,
+            id="percent-in-url",
+        ),
+        pytest.param(
+            "\\documentclass{article}\n\\begin{document}\n"
+            "\\href{http://example.com/a%20b}{link} and \\verb|50%| % note }\n"
+            "\\end{document}\n",
+            True,
+            None,
+            id="percent-in-href-and-verb",
+        ),
+        pytest.param(
+            "\\documentclass{article}\n\\begin{document}\nHello {world % }\n\\end{document}\n",
+            False,
+            "brace",
+            id="brace-masked-by-comment",
+        ),
+        pytest.param(
+            "\\documentclass[12pt{article}\n\\begin{document}\nHello\n\\end{document}\n",
+            False,
+            "bracket",
+            id="unmatched-brackets",
+        ),
+    ],
+)
+def test_validate_latex_syntax(verifier, tmp_path, body, valid, needle):
+    """Test syntax validation of valid and malformed documents."""
+    tex_file = tmp_path / "test.tex"
+    tex_file.write_text(body)
+
+    is_valid, errors = verifier.validate_latex_syntax(tex_file)
+    assert is_valid is valid, f"LaTeX validation errors: {errors}"
+    if needle is None:
+        assert errors == []
+    else:
+        assert any(needle in e.lower() for e in errors)
+
+
+def test_validate_reports_empty_text_at_debug(tmp_path, caplog):
+    """Test the text-extraction probe runs when DEBUG logging is enabled."""
+    caplog.set_level(logging.DEBUG, logger="ocrsuite.latex_verifier")
+    tex_file = tmp_path / "empty.tex"
+    tex_file.write_text("\\documentclass{article}\n\\begin{document}\n\\end{document}\n")
+
+    is_valid, _ = LaTeXVerifier().validate_latex_syntax(tex_file)
+    assert is_valid
+    assert "no extractable text content" in caplog.text
 
 
 def test_validate_missing_file():
@@ -71,6 +147,29 @@ def test_validate_missing_file():
     assert any("not found" in e.lower() for e in errors)
 
 
+def test_validate_directory_is_not_found(verifier, tmp_path):
+    """Test a directory is reported as missing rather than failing to read."""
+    is_valid, errors = verifier.validate_latex_syntax(tmp_path)
+    assert not is_valid
+    assert errors == [f"File not found: {tmp_path}"]
+
+
+def test_compile_default_output_path(tmp_path, mocker):
+    """Test the default PDF path sits next to the .tex file."""
+    tex_file = tmp_path / "doc.tex"
+    tex_file.write_text("\\documentclass{article}\n\\begin{document}\n\\end{document}\n")
+    mock_run = mocker.patch("ocrsuite.latex_verifier.subprocess.run")
+    mock_run.return_value.returncode = 0
+
+    verifier = LaTeXVerifier()
+    verifier.has_tectonic = True
+    success, message = verifier.compile_to_pdf(tex_file)
+
+    assert success
+    assert message == f"Compiled to {tmp_path / 'doc.pdf'}"
+    assert mock_run.call_args.args[0] == ["tectonic", str(tex_file), "-o", str(tmp_path)]
+
+
 def test_get_status():
     """Test status message generation."""
     verifier = LaTeXVerifier()
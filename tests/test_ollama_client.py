@@ -2,19 +2,27 @@
 
 import base64
 
+import orjson
 import pytest
+import requests
 
 from ocrsuite.config import OllamaConfig
 from ocrsuite.ollama_client import OllamaClient
 from ocrsuite.utils import OllamaError
 
 
-def test_ollama_client_init():
-    config = OllamaConfig(url="http://localhost:11434", model="llama2-vision")
-    client = OllamaClient(config)
-    assert client.url == "http://localhost:11434"
-    assert client.model == "llama2-vision"
-    assert client.timeout == 600
+@pytest.fixture(scope="module")
+def ollama_client():
+    """Client shared by tests that only need the default configuration."""
+    client = OllamaClient(OllamaConfig(url="http://localhost:11434", model="ocrsuite-deepseek"))
+    yield client
+    client.close()
+
+
+def test_ollama_client_init(ollama_client):
+    assert ollama_client.url == "http://localhost:11434"
+    assert ollama_client.model == "ocrsuite-deepseek"
+    assert ollama_client.timeout == 600
 
 
 def test_ollama_client_url_trailing_slash():
@@ -23,51 +31,59 @@ def test_ollama_client_url_trailing_slash():
     assert client.url == "http://localhost:11434"
 
 
-def test_health_check_failure():
-    config = OllamaConfig(url="http://localhost:99999")
-    client = OllamaClient(config)
-    assert not client.health_check()
+def test_health_check_failure(ollama_client, mocker):
+    mock_get = mocker.patch(
+        "requests.Session.get", side_effect=requests.ConnectionError("Connection refused")
+    )
+
+    assert not ollama_client.health_check()
+    mock_get.assert_called_once_with("http://localhost:11434/api/tags", timeout=5)
 
 
 def test_encode_image(sample_image):
     encoded = OllamaClient._encode_image(sample_image)
-    assert isinstance(encoded, str)
+    assert isinstance(encoded, bytes)
     decoded = base64.b64decode(encoded)
     original = sample_image.read_bytes()
     assert decoded == original
 
 
-def test_ocr_image_mocked(sample_image, mocker):
-    mock_post = mocker.patch("requests.post")
+def test_ocr_image_mocked(ollama_client, sample_image, mocker):
+    mock_post = mocker.patch("requests.Session.post")
     mock_post.return_value.status_code = 200
-    mock_post.return_value.json.return_value = {"response": "Extracted text from page."}
+    mock_post.return_value.content = orjson.dumps({"response": "Extracted text from page."})
 
-    config = OllamaConfig(url="http://localhost:11434", model="ocrsuite-deepseek")
-    client = OllamaClient(config)
-    result = client.ocr_image(sample_image)
+    result = ollama_client.ocr_image(sample_image)
 
     assert result == "Extracted text from page."
+    call_data = orjson.loads(mock_post.call_args.kwargs["data"])
+    assert call_data["model"] == "ocrsuite-deepseek"
+    assert base64.b64decode(call_data["images"][0]) == sample_image.read_bytes()
 
 
-def test_ocr_image_default_prompt(sample_image, mocker):
+def test_ocr_image_default_prompt(ollama_client, sample_image, mocker):
     """Verify the default prompt uses DeepSeek-OCR command syntax."""
-    mock_post = mocker.patch("requests.post")
+    mock_post = mocker.patch("requests.Session.post")
     mock_post.return_value.status_code = 200
-    mock_post.return_value.json.return_value = {"response": "OK"}
+    mock_post.return_value.content = orjson.dumps({"response": "OK"})
 
-    config = OllamaConfig(url="http://localhost:11434", model="ocrsuite-deepseek")
-    client = OllamaClient(config)
-    client.ocr_image(sample_image)
+    ollama_client.ocr_image(sample_image)
 
-    call_data = mock_post.call_args.kwargs["json"]
+    call_data = orjson.loads(mock_post.call_args.kwargs["data"])
     assert call_data["prompt"] == "Free OCR."
 
+    ollama_client.ocr_image(sample_image, prompt="<|grounding|>Convert the document to markdown.")
+    call_data = orjson.loads(mock_post.call_args.kwargs["data"])
+    assert call_data["prompt"] == "<|grounding|>Convert the document to markdown."
+
 
 def test_retry_exhaustion(sample_image, mocker):
-    mock_post = mocker.patch("requests.post")
+    mock_post = mocker.patch("requests.Session.post")
     from requests.exceptions import ConnectionError as ReqConnectionError
 
     mock_post.side_effect = ReqConnectionError("Connection refused")
+    mocker.patch("ocrsuite.ollama_client.time.sleep")
+    encode = mocker.spy(OllamaClient, "_encode_image")
 
     config = OllamaConfig(url="http://localhost:11434", model="ocrsuite-deepseek", max_retries=2)
     client = OllamaClient(config)
@@ -76,17 +92,48 @@ def test_retry_exhaustion(sample_image, mocker):
         client.ocr_image(sample_image)
 
     assert mock_post.call_count == 3  # initial + 2 retries
+    assert encode.call_count == 1  # retries reuse the encoded image
 
 
-def test_generate_text(mocker):
-    mock_post = mocker.patch("requests.post")
+def test_generate_text(ollama_client, mocker):
+    mock_post = mocker.patch("requests.Session.post")
     mock_post.return_value.status_code = 200
-    mock_post.return_value.json.return_value = {"response": "Generated text response."}
+    mock_post.return_value.content = orjson.dumps({"response": "Generated text response."})
 
-    config = OllamaConfig(url="http://localhost:11434", model="llava:13b")
-    client = OllamaClient(config)
-    result = client.generate_text("Hello")
+    result = ollama_client.generate_text("Hello")
 
     assert result == "Generated text response."
-    call_data = mock_post.call_args.kwargs["json"]
+    call_data = orjson.loads(mock_post.call_args.kwargs["data"])
     assert "images" not in call_data  # text-only, no images field
+
+
+def test_client_reuses_session(sample_image, mocker):
+    mock_post = mocker.patch("requests.Session.post")
+    mock_post.return_value.status_code = 200
+    mock_post.return_value.content = orjson.dumps({"response": "OK"})
+    close = mocker.patch("requests.Session.close")
+
+    with OllamaClient(OllamaConfig(parallelism=4)) as client:
+        client.ocr_image(sample_image)
+        client.ocr_image(sample_image)
+        adapter = client._session.get_adapter(client.url)
+        assert adapter._pool_maxsize == 4
+
+    assert mock_post.call_count == 2
+    close.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        ("table", "table"),
+        ("  Figure.\n", "figure"),
+        ("This page is mostly a table, with some text.", "table"),
+        ("Tables and figures", "unknown"),
+        ("", "unknown"),
+    ],
+)
+def test_classify_content(ollama_client, sample_image, mocker, response, expected):
+    mocker.patch.object(ollama_client, "_call_vision_model", return_value=response)
+
+    assert ollama_client.classify_content(sample_image)["type"] == expected
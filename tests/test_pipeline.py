@@ -0,0 +1,122 @@
+"""Tests for the shared page extraction pipeline."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from ocrsuite.assembler import OutputAssembler
+from ocrsuite.pipeline import extract_pages, ocr_page
+from ocrsuite.utils import OllamaError
+
+
+@pytest.fixture
+def page_images(tmp_path):
+    """Six empty page image files, as iter_pages() would yield them."""
+    images_dir = tmp_path / ".temp_images"
+    images_dir.mkdir()
+    pages = []
+    for index in range(6):
+        image_path = images_dir / f"page_{index + 1:04d}.png"
+        image_path.write_bytes(b"")
+        pages.append((index, image_path))
+    return pages
+
+
+def test_ocr_page_text(mocker):
+    client = mocker.Mock()
+    client.ocr_image.return_value = "Recognized text"
+
+    item = ocr_page(client, Path("page_0001.png"))
+    assert item == {"page": "page_0001", "type": "text", "content": "Recognized text"}
+
+
+def test_ocr_page_empty_response(mocker):
+    client = mocker.Mock()
+    client.ocr_image.return_value = "   "
+
+    item = ocr_page(client, Path("page_0002.png"))
+    assert item["type"] == "unknown"
+    assert item["content"] == "[Empty page or unrecognized content]"
+
+
+def test_extract_pages_keeps_page_order(page_images, tmp_path, mocker):
+    """Pages finishing out of order come back sorted; a failed page is only recorded."""
+    last_page_done = threading.Event()
+    finished = []
+
+    def ocr_image(image_path):
+        if image_path.stem == "page_0001":
+            # Hold the first page until the last one has been OCR'd
+            assert last_page_done.wait(timeout=5)
+        finished.append(image_path.stem)
+        if image_path.stem == "page_0004":
+            raise OllamaError("boom")
+        if image_path.stem == "page_0006":
+            last_page_done.set()
+        return f"text of {image_path.stem}"
+
+    client = mocker.Mock()
+    client.ocr_image.side_effect = ocr_image
+    assembler = OutputAssembler(tmp_path / "out")
+
+    # Page 3 comes from the text layer and is never rendered
+    rendered = [page for page in page_images if page[0] != 2]
+    extracted = extract_pages(
+        client, rendered, assembler, text_pages={2: "embedded text"}, workers=3
+    )
+
+    assert finished.index("page_0001") > finished.index("page_0006")
+    assert [item["page"] for item in extracted] == [
+        "page_0001",
+        "page_0002",
+        "page_0003",
+        "page_0005",
+        "page_0006",
+    ]
+    assert extracted[2]["content"] == "embedded text"
+    assert assembler.metadata["errors"] == ["page_0004.png: boom"]
+    assert assembler.metadata["pages_processed"] == 5
+
+
+def test_extract_pages_bounds_pages_in_flight(page_images, tmp_path, mocker):
+    client = mocker.Mock()
+    client.ocr_image.return_value = "text"
+    pulled = 0
+    collected = 0
+    in_flight = []
+
+    def pages():
+        nonlocal pulled
+        for page in page_images:
+            pulled += 1
+            in_flight.append(pulled - collected)
+            yield page
+
+    def on_page(page):
+        nonlocal collected
+        collected += 1
+
+    extract_pages(client, pages(), OutputAssembler(tmp_path / "out"), workers=2, on_page=on_page)
+
+    assert collected == len(page_images)
+    assert max(in_flight) <= 2 * 2
+
+
+@pytest.mark.parametrize("keep_images", [False, True])
+def test_extract_pages_image_cleanup(page_images, tmp_path, mocker, keep_images):
+    """Images are deleted as each page is collected, unless they are kept for debugging."""
+    client = mocker.Mock()
+    client.ocr_image.return_value = "text"
+    exists_when_collected = []
+
+    extract_pages(
+        client,
+        page_images,
+        OutputAssembler(tmp_path / "out"),
+        workers=2,
+        keep_images=keep_images,
+        on_page=lambda page: exists_when_collected.append(page.image_path.exists()),
+    )
+
+    assert exists_when_collected == [keep_images] * len(page_images)
@@ -1,11 +1,13 @@
 """Tests for preprocessing module."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pypdfium2 as pdfium
 import pytest
 
-from ocrsuite.preprocessor import PDFPreprocessor
-from ocrsuite.utils import PreprocessingError
+from ocrsuite.preprocessor import _PDFIUM_LOCK, PDFPreprocessor, _map_bounded
+from ocrsuite.utils import ConfigError, PreprocessingError
 
 
 def test_preprocessor_init():
@@ -20,18 +22,16 @@ def test_pdf_not_found():
         preprocessor.pdf_to_images(Path("nonexistent.pdf"), Path("."))
 
 
-def test_pdf_to_images_output_directory_created(tmp_path):
+@pytest.mark.slow
+@pytest.mark.integration
+def test_pdf_to_images_output_directory_created(minimal_pdf, tmp_path):
+    """The output directory exists even when the PDF itself cannot be read."""
     preprocessor = PDFPreprocessor()
     output_dir = tmp_path / "new_dir"
     assert not output_dir.exists()
 
-    pdf_path = tmp_path / "test.pdf"
-    pdf_path.write_bytes(b"%PDF-1.4\n")
-
-    try:
-        preprocessor.pdf_to_images(pdf_path, output_dir)
-    except PreprocessingError:
-        pass
+    with pytest.raises(PreprocessingError):
+        preprocessor.pdf_to_images(minimal_pdf, output_dir)
 
     assert output_dir.exists()
 
@@ -45,6 +45,25 @@ def test_get_pdf_info(sample_pdf):
     assert "metadata" in info
 
 
+def test_get_pdf_info_keys(metadata_pdf):
+    """Pin the page-info shape main and the GUI rely on.
+
+    Metadata holds only the standard Info string keys that are set; empty
+    values, custom keys and /Trapped are dropped.
+    """
+    with PDFPreprocessor() as preprocessor:
+        info = preprocessor.get_pdf_info(metadata_pdf)
+
+    assert info == {
+        "page_count": 1,
+        "metadata": {
+            "Title": "Old Book",
+            "Author": "A. Writer",
+            "CreationDate": "D:19990101000000Z",
+        },
+    }
+
+
 def test_pdf_to_images_with_sample(sample_pdf, tmp_path):
     preprocessor = PDFPreprocessor(dpi=72)
     output_dir = tmp_path / "images"
@@ -54,3 +73,111 @@ def test_pdf_to_images_with_sample(sample_pdf, tmp_path):
     for img in images:
         assert img.exists()
         assert img.suffix == ".png"
+
+
+def test_iter_images_is_lazy(sample_pdf, tmp_path):
+    preprocessor = PDFPreprocessor(dpi=72)
+    output_dir = tmp_path / "images"
+
+    pages = preprocessor.iter_images(sample_pdf, output_dir)
+    assert not output_dir.exists()
+
+    first = next(pages)
+    assert first == output_dir / "page_0001.png"
+    assert first.exists()
+
+
+def test_pdf_to_images_parallel(sample_pdf, tmp_path):
+    sequential = PDFPreprocessor(dpi=72).pdf_to_images(sample_pdf, tmp_path / "seq")
+    parallel = PDFPreprocessor(dpi=72, workers=2).pdf_to_images(sample_pdf, tmp_path / "par")
+
+    assert [p.name for p in parallel] == [p.name for p in sequential]
+    for seq_img, par_img in zip(sequential, parallel, strict=True):
+        assert par_img.read_bytes() == seq_img.read_bytes()
+
+
+def test_map_bounded_limits_work_ahead(mocker):
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        submit = mocker.spy(pool, "submit")
+        results = _map_bounded(pool, str, range(40), window=4)
+
+        assert next(results) == "0"
+        # Page 0 is with the caller; only the window beyond it was submitted
+        assert submit.call_count == 5
+        assert list(results) == [str(n) for n in range(1, 40)]
+
+
+def test_pdf_to_images_jpeg(sample_pdf, tmp_path):
+    images = PDFPreprocessor(dpi=72, image_format="jpeg").pdf_to_images(sample_pdf, tmp_path)
+
+    assert images
+    for img in images:
+        assert img.suffix == ".jpg"
+        assert img.read_bytes()[:3] == b"\xff\xd8\xff"
+
+
+def test_unsupported_image_format():
+    with pytest.raises(ConfigError):
+        PDFPreprocessor(image_format="tiff")
+
+
+def test_get_pdf_info_document_reused(sample_pdf, tmp_path, mocker):
+    opened = mocker.spy(pdfium, "PdfDocument")
+    preprocessor = PDFPreprocessor(dpi=72)
+
+    info = preprocessor.get_pdf_info(sample_pdf)
+    images = preprocessor.pdf_to_images(sample_pdf, tmp_path)
+
+    assert len(images) == info["page_count"]
+    assert opened.call_count == 1
+
+
+def test_close_releases_kept_document(sample_pdf, mocker):
+    closed = mocker.spy(pdfium.PdfDocument, "close")
+
+    with PDFPreprocessor() as preprocessor:
+        preprocessor.get_pdf_info(sample_pdf)
+        assert preprocessor._document is not None
+
+    assert preprocessor._document is None
+    closed.assert_called_once()
+
+
+def test_pdfium_calls_hold_lock(text_pdf, tmp_path, mocker):
+    """PDFium is not thread-safe; rendering and text extraction serialize on one lock."""
+    held = []
+
+    def recording_lock_state(method):
+        def wrapper(self, *args, **kwargs):
+            held.append(_PDFIUM_LOCK.locked())
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    for name in ("render", "get_textpage"):
+        mocker.patch.object(
+            pdfium.PdfPage, name, recording_lock_state(getattr(pdfium.PdfPage, name))
+        )
+
+    with PDFPreprocessor(dpi=72) as preprocessor:
+        preprocessor.extract_text_layer(text_pdf)
+        preprocessor.pdf_to_images(text_pdf, tmp_path)
+
+    assert held and all(held)
+    assert not _PDFIUM_LOCK.locked()
+
+
+def test_extract_text_layer(text_pdf):
+    texts = PDFPreprocessor().extract_text_layer(text_pdf)
+
+    assert list(texts) == [0]
+    assert texts[0].startswith("The quick brown fox")
+
+
+def test_iter_pages_skips_text_pages(text_pdf, tmp_path):
+    preprocessor = PDFPreprocessor(dpi=72)
+    texts = preprocessor.extract_text_layer(text_pdf)
+
+    pages = list(preprocessor.iter_pages(text_pdf, tmp_path, skip_pages=texts.keys()))
+
+    assert [(index, path.name) for index, path in pages] == [(1, "page_0002.png")]
@@ -0,0 +1,46 @@
+"""Tests for utility helpers."""
+
+import pytest
+from loguru import logger
+
+from ocrsuite.utils import OCRSuiteError, ensure_directory, init_logging
+
+
+def test_init_logging_writes_file(tmp_path, restore_logging):
+    log_file = init_logging(tmp_path / "logs")
+
+    logger.debug("debug line for the file sink")
+    logger.complete()
+
+    assert log_file == tmp_path / "logs" / "log.txt"
+    assert "debug line for the file sink" in log_file.read_text(encoding="utf-8")
+
+
+def test_ensure_directory_creates_parents(tmp_path):
+    target = tmp_path / "a" / "b" / "c"
+
+    assert ensure_directory(target) == target
+    assert target.is_dir()
+
+
+def test_ensure_directory_existing(tmp_path):
+    assert ensure_directory(tmp_path) == tmp_path
+
+
+def test_ensure_directory_file_in_the_way(tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a directory")
+
+    with pytest.raises(OCRSuiteError, match="Failed to create directory"):
+        ensure_directory(blocker)
+
+
+def test_ensure_directory_recreates_removed_directory(tmp_path):
+    # Pipelines delete their temp image directory after each run and the GUI
+    # runs again in the same process, so results must never be cached
+    target = tmp_path / ".temp_images"
+    ensure_directory(target)
+    target.rmdir()
+
+    ensure_directory(target)
+    assert target.is_dir()